@@ -14,7 +14,7 @@ import numpy as np
 from functools import partial
 import warnings
 
-from .utils import logger
+from .utils import logger, _get_vertno_sets
 
 
 def check_callable(context, fun, *args, **kwargs):
@@ -101,6 +101,8 @@ def check_vertices_in_src(vertices, src):
     ValueError
         In case any vertex is not present in the provided src.
     """
+
+    src_vertno = _get_vertno_sets(src)
     for v in vertices:
         src_idx, vertno = v
         if src_idx >= len(src):
@@ -108,7 +110,7 @@ def check_vertices_in_src(vertices, src):
                              f"which is not present in the provided src")
         
         vertno = [vertno] if not isinstance(vertno, list) else vertno
-        missing_vertno = set(vertno) - set(src[src_idx]['vertno'])
+        missing_vertno = set(vertno) - src_vertno[src_idx]
         if missing_vertno:
             report_missing = ", ".join([str(v) for v in missing_vertno])
             vertex_desc = "Vertex" if len(missing_vertno) == 1 else "Vertices"
@@ -184,7 +186,8 @@ def check_waveform(waveform, waveform_params, n_sources):
     -------
     waveform: np.array or functools.partial
         Checked waveform array or function (partial object which does not 
-        require additional arguments anymore).
+        require additional arguments anymore). The provided array is returned
+        as is without making a copy.
 
     Raises
     ------
@@ -245,8 +248,10 @@ def check_names(names, n_sources, existing):
         raise ValueError('The number of provided source names does not match '
                          'the number of defined sources')
 
-    # All names should be non-empty strings
+    existing = set(existing)
+    seen = set()
     for name in names:
+        # All names should be non-empty strings
         if not isinstance(name, str):
             actual_type = type(name).__name__
             raise ValueError(f"Expected all names to be strings, got {actual_type}: {name}")
@@ -260,10 +265,11 @@ def check_names(names, n_sources, existing):
         
         if name in existing:
             raise ValueError(f"Name {name} is already taken by another source")
-        
-    # Check that all names are unique
-    if len(names) != len(set(names)):
-        raise ValueError('All names should be unique')
+
+        # Check that all names are unique
+        if name in seen:
+            raise ValueError('All names should be unique')
+        seen.add(name)
 
 
 def check_snr(snr, n_sources):
@@ -288,7 +294,7 @@ def check_snr(snr, n_sources):
     if snr is None:
         return None
     
-    snr = np.ravel(np.array(snr))
+    snr = np.ravel(np.array(snr, dtype=float))
     if snr.size != 1 and snr.size != n_sources:
         raise ValueError(
             f'Expected either one SNR value that applies to all sources or '
@@ -301,7 +307,7 @@ def check_snr(snr, n_sources):
 
     # Broadcast to all sources if a single value was provided
     if snr.size == 1:
-        snr = np.tile(snr, (n_sources,))
+        snr = np.full((n_sources,), snr[0])
     
     return snr
 
@@ -4,8 +4,9 @@ Methods for setting the coupling between two signals
 
 import numpy as np
 
-from scipy.stats import vonmises
-from scipy.signal import butter, filtfilt, hilbert
+from scipy.signal import hilbert
+
+from .utils import _filter_bandpass
 
 
 def constant_phase_shift(waveform, sfreq, phase_lag, m=1, n=1, random_state=None):
@@ -46,10 +47,10 @@ def constant_phase_shift(waveform, sfreq, phase_lag, m=1, n=1, random_state=None
     if not np.iscomplexobj(waveform):
         waveform = hilbert(waveform)
 
+    # Only the real part of the shifted analytic signal is needed
     waveform_amp = np.abs(waveform)
     waveform_angle = np.angle(waveform)
-    waveform_coupled = waveform_amp * np.exp(1j * m / n * waveform_angle + 1j * phase_lag)
-    return np.real(waveform_coupled)
+    return waveform_amp * np.cos(m / n * waveform_angle + phase_lag)
 
 
 def ppc_von_mises(waveform, sfreq, phase_lag, kappa, fmin, fmax, m=1, n=1, random_state=None):
@@ -106,10 +107,9 @@ def ppc_von_mises(waveform, sfreq, phase_lag, kappa, fmin, fmax, m=1, n=1, rando
     waveform_angle = np.angle(waveform)
     n_samples = len(waveform)
 
-    ph_distr = vonmises.rvs(kappa, loc=phase_lag, size=n_samples, random_state=random_state)
-    tmp_waveform = np.real(waveform_amp * np.exp(1j * m / n * waveform_angle + 1j * ph_distr))
-    b, a = butter(N=2, Wn=np.array([m / n * fmin, m / n * fmax]) / sfreq * 2, btype='bandpass')
-    tmp_waveform = filtfilt(b, a, tmp_waveform)
-    waveform_coupled = waveform_amp * np.exp(1j * np.angle(hilbert(tmp_waveform)))
+    rng = np.random.default_rng(seed=random_state)
+    ph_distr = rng.vonmises(phase_lag, kappa, size=n_samples)
 
-    return np.real(waveform_coupled)
+    tmp_waveform = waveform_amp * np.cos(m / n * waveform_angle + ph_distr)
+    tmp_waveform = _filter_bandpass(tmp_waveform, sfreq, m / n * fmin, m / n * fmax)
+    return waveform_amp * np.cos(np.angle(hilbert(tmp_waveform)))
@@ -18,9 +18,10 @@ def traverse_tree(tree, start_node=None, random_state=None):
     start_node : int
         The node from which to start generating paths. 
         If start_node is None (default), the start node will be drawn randomly.
-    random_state : int or None, optional
-        Seed for the random number generator. If start_node is None (default), the 
-        start node will be drawn randomly, and results will vary between function calls.
+    random_state : int, np.random.Generator or None, optional
+        Seed for the random number generator or the generator itself. If start_node 
+        is None (default), the start node will be drawn randomly, and results will 
+        vary between function calls.
 
     Returns:
     -------
@@ -56,17 +57,29 @@ def generate_walkaround(coupling_graph, random_state=None):
         desired coupling for all the edges.
     """
 
-    if not nx.is_forest(coupling_graph):
+    # A forest has exactly V - C edges, where C is the number of components
+    n_nodes = coupling_graph.number_of_nodes()
+    n_edges = coupling_graph.number_of_edges()
+    components = list(nx.connected_components(coupling_graph))
+    if n_edges != n_nodes - len(components):
         raise ValueError("The graph contains cycles. Cycles are not supported.")
 
+    # Insertion order of the graph is used on purpose: subgraph views may follow
+    # the order of the component set, which depends on the hash seed
+    component_idx = {node: i for i, component in enumerate(components)
+                     for node in component}
+    component_nodes = [[] for _ in components]
+    for node in coupling_graph:
+        component_nodes[component_idx[node]].append(node)
+
     # iterate over connected components
     walkaround = []
-    for component in nx.connected_components(coupling_graph):
-        subgraph = coupling_graph.subgraph(component)
-
-        # build the path starting from random node
-        walkaround_paths = traverse_tree(subgraph, start_node=None, 
-                                         random_state=random_state)
+    for nodes in component_nodes:
+        # build the path starting from random node, the traversal does not
+        # leave the connected component of the start node
+        rng = np.random.default_rng(random_state)
+        start_node = rng.choice(nodes)
+        walkaround_paths = traverse_tree(coupling_graph, start_node=start_node)
         walkaround.extend(walkaround_paths)
 
     return walkaround
@@ -95,6 +108,8 @@ def _set_coupling(sources, coupling_graph, times, random_state):
     """
     walkaround = generate_walkaround(coupling_graph, random_state=random_state)
 
+    # The sampling frequency is the same for all edges
+    sfreq = get_sfreq(times)
     for name1, name2 in walkaround:
         # Get the sources by their names
         s1, s2 = sources[name1], sources[name2]
@@ -107,7 +122,7 @@ def _set_coupling(sources, coupling_graph, times, random_state):
         coupling_fn = tmp_coupling_params.pop('method')
 
         # Adjust the waveform of s2 to be coupled with s1
-        s2.waveform = coupling_fn(s1.waveform, get_sfreq(times), 
+        s2.waveform = coupling_fn(s1.waveform, sfreq, 
                                   **tmp_coupling_params,
                                   random_state=random_state)
 
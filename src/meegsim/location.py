@@ -7,7 +7,7 @@ Many options are already covered by mne.simulation.select_source_in_label so we
 """
 import numpy as np
 
-from meegsim.utils import unpack_vertices
+from meegsim.utils import unpack_vertices, _get_vertno_sets
 
 
 def select_random(src, *, n=1, vertices=None, sort_output=False, random_state=None):
@@ -44,12 +44,22 @@ def select_random(src, *, n=1, vertices=None, sort_output=False, random_state=No
     if len(src) not in [1, 2]:
         raise ValueError("Src must contain either one (volume) or two (surface) source spaces.")
 
-    src_unpacked = unpack_vertices([list(s['vertno']) for s in src])
-
-    vertices = unpack_vertices(vertices) if vertices else src_unpacked
-    vertices_not_in_src = set(vertices) - set(src_unpacked)
-    if vertices_not_in_src:
-        raise ValueError("Some vertices are not contained in the src.")
+    if vertices:
+        # Membership is checked before any conversion to arrays, so that
+        # non-integer vertices are reported instead of being truncated
+        src_vertno = _get_vertno_sets(src)
+        vertices = unpack_vertices(vertices)
+        is_present = all(
+            src_idx in range(len(src)) and vertno in src_vertno[src_idx]
+            for src_idx, vertno in vertices
+        )
+        if not is_present:
+            raise ValueError("Some vertices are not contained in the src.")
+    else:
+        vertices = np.concatenate([
+            np.column_stack([np.full(len(s['vertno']), src_idx), s['vertno']])
+            for src_idx, s in enumerate(src)
+        ])
 
     if n > len(vertices):
         raise ValueError("Number of vertices to select exceeds available vertices.")
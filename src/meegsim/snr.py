@@ -1,9 +1,8 @@
 import numpy as np
 import mne
 
-from scipy.signal import butter, filtfilt
-
 from .sources import _combine_sources_into_stc
+from .utils import _filter_bandpass
 
 
 def get_sensor_space_variance(stc, fwd, *, fmin=None, fmax=None, filter=False):
@@ -40,8 +39,7 @@ def get_sensor_space_variance(stc, fwd, *, fmin=None, fmax=None, filter=False):
                 'Frequency band limits are required for the adjustment of SNR.'
             )
 
-        b, a = butter(2, np.array([fmin, fmax]) / stc.sfreq * 2, btype='bandpass')
-        stc_data = filtfilt(b, a, stc_data, axis=1)        
+        stc_data = _filter_bandpass(stc_data, stc.sfreq, fmin, fmax)
 
     try:
         fwd_restrict = mne.forward.restrict_forward_to_stc(fwd, stc, 
@@ -231,7 +231,9 @@ class PatchSource(_BaseSource):
     
     @property
     def vertices(self):
-        return np.array([[self.src_idx, v] for v in self.vertno])
+        vertno = np.asarray(self.vertno)
+        src_idx = np.full(vertno.shape, self.src_idx)
+        return np.column_stack([src_idx, vertno])
 
     @classmethod
     def create(
@@ -277,9 +279,11 @@ class PatchSource(_BaseSource):
             # Grow the patch from center otherwise
             patch = mne.grow_labels(subject, vertno, extent, src_idx, subjects_dir=None)[0]
             
-            # Prune vertices
-            patch_vertno = [vert for vert in patch.vertices if vert in src[src_idx]['vertno']]
-            patch_vertices.append(patch_vertno)
+            # Prune vertices that are not present in the src (one pass over
+            # all vertices instead of scanning the src for each of them)
+            grown_vertno = np.asarray(patch.vertices)
+            is_used = np.isin(grown_vertno, src[src_idx]['vertno'])
+            patch_vertices.append(grown_vertno[is_used].tolist())
 
         # Create patch sources and save them as a group
         sources = []
@@ -339,9 +343,9 @@ def _combine_sources_into_stc(sources, src, tstep):
     n_samples = data_stacked.shape[1]
 
     # Place the time courses correctly accounting for repetitions
+    # np.add.at accumulates rows with repeated indices (unlike +=)
     data = np.zeros((n_unique, n_samples))
-    for idx_orig, idx_new in enumerate(indices):
-        data[idx_new, :] += data_stacked[idx_orig, :]
+    np.add.at(data, indices.ravel(), data_stacked)
 
     # Convert vertices to the MNE format
     vertices = vertices_to_mne(unique_vertices, src)
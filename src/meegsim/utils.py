@@ -2,12 +2,20 @@ import logging
 import numpy as np
 import warnings
 
+from functools import lru_cache
 from mne.io.constants import FIFF
-from scipy.special import i1, i0
+from scipy.signal import butter, sosfiltfilt
+from scipy.special import i1e, i0e
 
 
 logger = logging.getLogger('meegsim')
 
+# Human-readable names of hemispheres for surface source spaces
+_HEMI_BY_ID = {
+    FIFF.FIFFV_MNE_SURF_LEFT_HEMI: 'lh',
+    FIFF.FIFFV_MNE_SURF_RIGHT_HEMI: 'rh',
+}
+
 
 def combine_stcs(stc1, stc2):
     """
@@ -36,33 +44,47 @@ def combine_stcs(stc1, stc2):
 
     # Keep track of the offset in stc.data while iterating over hemispheres
     offsets_old = [0]
-    offsets_new = [0]
-    
+    offset_new = 0
+
+    # Mark the rows of stc2.data that still need to be inserted (i.e., the
+    # ones that correspond to vertices which are not present in stc1)
+    is_inserted = np.ones(stc2.data.shape[0], dtype=bool)
+
     stc = stc1.copy()
-    new_data = stc2.data.copy()
     for vi, (v_old, v_new) in enumerate(zip(stc.vertices, stc2.vertices)):
-        v_common, ind1, ind2 = np.intersect1d(v_old, v_new, return_indices=True)
-        if v_common.size > 0:
+        # Vertices of an stc are always sorted, so binary search is enough
+        # to find the vertices of stc2 that are also present in stc1
+        inds = np.searchsorted(v_old, v_new)
+        is_common = np.zeros(v_new.shape, dtype=bool)
+
+        # Common vertices are only possible if the ranges of vertices overlap,
+        # which is often not the case (e.g., when combining signal and noise)
+        is_overlap = (v_old.size and v_new.size and
+                      v_old[0] <= v_new[-1] and v_new[0] <= v_old[-1])
+        if is_overlap:
+            in_range = inds < v_old.size
+            is_common[in_range] = v_old[inds[in_range]] == v_new[in_range]
+
+        if np.any(is_common):
             # Sum up signals for vertices common to stc1 and stc2
-            ind1 = ind1 + offsets_old[-1]
-            ind2 = ind2 + offsets_new[-1]
-            stc.data[ind1] += new_data[ind2]
+            ind1 = inds[is_common] + offsets_old[-1]
+            ind2 = np.flatnonzero(is_common) + offset_new
+            stc.data[ind1] += stc2.data[ind2]
 
-            # Delete the common vertices from stc2 since they do not need
+            # Skip the common vertices from stc2 since they do not need
             # to be processed anymore
-            new_data = np.delete(new_data, ind2, axis=0)
-            v_new = v_new[np.isin(v_new, v_common, invert=True)]
+            is_inserted[ind2] = False
+            inds = inds[~is_common]
 
-        # Find where to insert the remaining vertices from stc2
-        inds = np.searchsorted(v_old, v_new)
-        stc.vertices[vi] = np.insert(v_old, inds, v_new)
-        inserters += [inds.copy()]
-        offsets_old += [len(v_old)]
-        offsets_new += [len(v_new)]
+        # Insert the remaining vertices from stc2
+        stc.vertices[vi] = np.insert(v_old, inds, v_new[~is_common])
+        inserters += [inds]
+        offsets_old += [offsets_old[-1] + len(v_old)]
+        offset_new += len(v_new)
 
     inds = [ii + offset for ii, offset in zip(inserters, offsets_old[:-1])]
     inds = np.concatenate(inds)
-    stc.data = np.insert(stc.data, inds, new_data, axis=0)
+    stc.data = np.insert(stc.data, inds, stc2.data[is_inserted], axis=0)
 
     return stc
 
@@ -70,22 +92,85 @@ def combine_stcs(stc1, stc2):
 def normalize_power(data):
     """
     Divide the time series by its norm to normalize the variance.
+    The normalization is performed in place to avoid copying the data.
 
     Parameters
     ----------
     data: array, shape (n_series, n_samples)
-        Time series to be normalized.
+        Time series to be normalized. The array is modified in place.
 
     Returns
     -------
     data: array
-        Normalized time series. The norm of each row is equal to 1.
+        Normalized time series (the same array as the input). The norm of
+        each row is equal to 1.
     """
 
-    data /= np.linalg.norm(data, axis=1)[:, np.newaxis]
+    scale = np.einsum('ij,ij->i', data, data)
+    np.sqrt(scale, out=scale)
+    np.reciprocal(scale, out=scale)
+    data *= scale[:, np.newaxis]
     return data
 
-  
+
+@lru_cache(maxsize=128)
+def _butter_bandpass(order, fmin, fmax, sfreq):
+    """
+    Design a Butterworth band-pass filter. The coefficients are cached since
+    the same filter is typically applied many times during the simulation.
+
+    Parameters
+    ----------
+    order: int
+        The order of the filter.
+    fmin: float
+        Lower cutoff frequency (in Hz).
+    fmax: float
+        Upper cutoff frequency (in Hz).
+    sfreq: float
+        Sampling frequency (in Hz).
+
+    Returns
+    -------
+    sos: array, shape (n_sections, 6)
+        Second-order sections of the filter. The array is shared between all
+        calls with the same arguments, so it should not be modified.
+    """
+
+    return butter(N=order, Wn=np.array([fmin, fmax]) / sfreq * 2,
+                  btype='bandpass', output='sos')
+
+
+def _filter_bandpass(data, sfreq, fmin, fmax, order=2):
+    """
+    Apply a zero-phase Butterworth band-pass filter to the time series.
+
+    Parameters
+    ----------
+    data: array, shape (..., n_samples)
+        Time series to be filtered. The filter is applied along the last axis.
+    sfreq: float
+        Sampling frequency (in Hz).
+    fmin: float
+        Lower cutoff frequency (in Hz).
+    fmax: float
+        Upper cutoff frequency (in Hz).
+    order: int, optional
+        The order of the filter. By default, the order is equal to 2.
+
+    Returns
+    -------
+    data: array
+        Filtered time series.
+    """
+
+    # Arguments should be hashable for the coefficients to be cached
+    sos = _butter_bandpass(int(order), float(fmin), float(fmax), float(sfreq))
+
+    data = np.ascontiguousarray(data)
+    return sosfiltfilt(sos, data, axis=-1)
+
+
 def _extract_hemi(src):
     """
     Extract a human-readable name (lh or rh) for the provided source space
@@ -112,16 +197,32 @@ def _extract_hemi(src):
 
     if src['type'] != 'surf':
         return None
-    
-    if src['id'] == FIFF.FIFFV_MNE_SURF_LEFT_HEMI:
-        return 'lh'
-    
-    if src['id'] == FIFF.FIFFV_MNE_SURF_RIGHT_HEMI:
-        return 'rh'
-    
-    raise ValueError("Unexpected ID for the provided surface source space. "
-                     "Please check the code that was used to generate and/or "
-                     "manipulate the src, it should not change the 'id' field.")
+
+    hemi = _HEMI_BY_ID.get(src['id'])
+    if hemi is None:
+        raise ValueError("Unexpected ID for the provided surface source space. "
+                         "Please check the code that was used to generate and/or "
+                         "manipulate the src, it should not change the 'id' field.")
+
+    return hemi
+
+
+def _get_vertno_sets(src):
+    """
+    Collect the vertices of each source space into a set for fast lookup.
+
+    Parameters
+    ----------
+    src: mne.SourceSpaces
+        The source spaces to process.
+
+    Returns
+    -------
+    vertno_sets: list of frozenset
+        One set of vertices for each source space in the provided src.
+    """
+
+    return [frozenset(s['vertno'].tolist()) for s in src]
 
 
 def get_sfreq(times):
@@ -183,7 +284,24 @@ def unpack_vertices(vertices_lists):
 
 
 def theoretical_plv(kappa):
-    return i1(kappa) / i0(kappa)
+    """
+    Calculate the theoretical value of PLV for phase differences that follow
+    the von Mises distribution with the provided concentration parameter.
+
+    Parameters
+    ----------
+    kappa: float or array
+        Concentration parameter(s) of the von Mises distribution.
+
+    Returns
+    -------
+    plv: float or array
+        The theoretical value(s) of PLV.
+    """
+
+    # Scaled Bessel functions do not overflow for large kappa, and the
+    # scaling factor cancels out
+    return i1e(kappa) / i0e(kappa)
 
 
 def vertices_to_mne(vertices, src):
@@ -193,9 +311,14 @@ def vertices_to_mne(vertices, src):
 
     vertices = np.array(vertices)
     packed_vertices = [[] for _ in src]
-    for src_idx in np.unique(vertices[:, 0]):
-        src_vertices = vertices[vertices[:, 0] == src_idx, :]
-        src_vertno = list(np.sort(src_vertices[:, 1]))
-        packed_vertices[src_idx] = src_vertno
+
+    # Sort by source space first and vertno second, then split the sorted
+    # vertno into groups corresponding to each of the source spaces
+    order = np.lexsort((vertices[:, 1], vertices[:, 0]))
+    vertices = vertices[order]
+    src_indices, starts = np.unique(vertices[:, 0], return_index=True)
+    src_vertno = np.split(vertices[:, 1], starts[1:])
+    for src_idx, vertno in zip(src_indices, src_vertno):
+        packed_vertices[src_idx] = vertno.tolist()
 
     return packed_vertices
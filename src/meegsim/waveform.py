@@ -2,13 +2,12 @@
 Template waveforms: narrowband oscillation, white and 1/f noise
 """
 
-import colorednoise as cn
 import numpy as np
 import warnings
 
-from scipy.signal import butter, filtfilt
+from scipy.fft import irfft, rfftfreq
 
-from .utils import normalize_power, get_sfreq
+from .utils import normalize_power, get_sfreq, _filter_bandpass
 
 
 def narrowband_oscillation(n_series, times, *, fmin=None, fmax=None, order=2, random_state=None):
@@ -63,8 +62,7 @@ def narrowband_oscillation(n_series, times, *, fmin=None, fmax=None, order=2, ra
     fs = get_sfreq(times)
     rng = np.random.default_rng(seed=random_state)
     data = rng.standard_normal(size=(n_series, times.size))
-    b, a = butter(N=order, Wn=np.array([fmin, fmax]) / fs * 2, btype='bandpass')
-    data = filtfilt(b, a, data, axis=1)
+    data = _filter_bandpass(data, fs, fmin, fmax, order=order)
     return normalize_power(data)
 
 
@@ -93,7 +91,27 @@ def one_over_f_noise(n_series, times, *, slope=1, random_state=None):
         Generated 1/f noise.
     """
 
-    data = cn.powerlaw_psd_gaussian(slope, size=(n_series, times.size), random_state=random_state)
+    n_times = times.size
+    rng = np.random.default_rng(seed=random_state)
+
+    # Scale the amplitude spectrum of white noise according to the power law,
+    # the lowest non-zero frequency is also used for the DC component
+    freqs = rfftfreq(n_times)
+    freqs[0] = 1. / n_times
+    scale = freqs ** (-slope / 2.)
+
+    # Same order of random draws as in colorednoise for reproducibility
+    size = (n_series, freqs.size)
+    spectrum = np.empty(size, dtype=np.complex128)
+    spectrum.real = rng.standard_normal(size=size) * scale
+    spectrum.imag = rng.standard_normal(size=size) * scale
+
+    # DC and Nyquist (for even number of samples) components should be real
+    spectrum[:, 0] = spectrum[:, 0].real * np.sqrt(2)
+    if n_times % 2 == 0:
+        spectrum[:, -1] = spectrum[:, -1].real * np.sqrt(2)
+
+    data = irfft(spectrum, n=n_times, axis=-1)
     return normalize_power(data)
     
 
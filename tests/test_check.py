@@ -1,3 +1,4 @@
+import re
 import numpy as np
 import networkx as nx
 import pytest
@@ -85,6 +86,32 @@ def test_check_vertices_in_src_raises():
         check_vertices_in_src([(0, [0, 2, 3])], src)
 
 
+def test_check_vertices_in_src_non_integer_raises():
+    src = prepare_source_space(
+        types=['surf', 'surf'],
+        vertices=[[0, 1], [0, 1]]
+    )
+
+    with pytest.raises(ValueError, match='Vertex 1.5 is not present'):
+        check_vertices_in_src([(0, 1.5)], src)
+
+    with pytest.raises(ValueError, match='Vertex 1 is not present'):
+        check_vertices_in_src([(0, '1')], src)
+
+    with pytest.raises(ValueError, match=re.escape('Vertex 1.7 is not present in the provided src[1]')):
+        check_vertices_in_src([(0, [0, 1]), (1, 1.7)], src)
+
+
+def test_check_vertices_in_src_empty_list_bad_src_idx():
+    src = prepare_source_space(
+        types=['surf', 'surf'],
+        vertices=[[0, 1], [0, 1]]
+    )
+
+    with pytest.raises(ValueError, match=re.escape('Vertex (5, []) belongs to')):
+        check_vertices_in_src([(5, [])], src)
+
+
 def test_check_location_using_arrays():
     location = [(0, 0), (1, 1)]
     src = prepare_source_space(
@@ -135,8 +162,8 @@ def test_check_waveform_with_arrays():
         n_sources=2
     )
 
-    assert np.array_equal(checked, waveform), \
-        "The provided waveform was changed"
+    assert checked is waveform, \
+        "The provided waveform should be returned without copying"
     
 
 def test_check_waveform_array_bad_shape_raises():
@@ -205,6 +232,12 @@ def test_check_snr_array_valid_shape_passes():
     assert np.array_equal(snr, initial)
 
 
+def test_check_snr_array_is_copied():
+    initial = np.array([1., 2., 3.])
+    snr = check_snr(initial, 3)
+    assert not np.shares_memory(snr, initial)
+
+
 def test_check_snr_array_invalid_shape_raises():
     initial = [1, 2, 3, 4, 5]
     with pytest.raises(ValueError, match="of the 3 sources, got 5"):
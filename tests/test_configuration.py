@@ -1,13 +1,19 @@
 import numpy as np
 import pytest
 
-from mock import patch
+from unittest.mock import patch
 from meegsim.configuration import SourceConfiguration
 from meegsim.sources import PointSource, PatchSource
 
 from utils.prepare import prepare_source_space
 
 
+# Constant waveform that is shared by all sources (sfreq=250, duration=30).
+# It is read-only to make sure that it is not modified by any of the tests.
+WAVEFORM = np.ones((250 * 30,))
+WAVEFORM.setflags(write=False)
+
+
 def test_sourceconfiguration_to_stc_empty_raises():
     src = prepare_source_space(
         types=['surf', 'surf'],
@@ -28,8 +34,8 @@ def test_sourceconfiguration_to_stc_noise_only():
 
     sc = SourceConfiguration(src, sfreq=250, duration=30)
     sc._noise_sources = {
-        'n1': PointSource('n1', 0, 0, np.ones((250 * 30,))),
-        'n2': PointSource('n2', 0, 1, np.ones((250 * 30,))),
+        'n1': PointSource('n1', 0, 0, WAVEFORM),
+        'n2': PointSource('n2', 0, 1, WAVEFORM),
     }
     stc = sc.to_stc()
     assert stc.data.shape[0] == 2, 'Expected two sources in stc'
@@ -43,8 +49,8 @@ def test_sourceconfiguration_to_stc_signal_only():
 
     sc = SourceConfiguration(src, sfreq=250, duration=30)
     sc._sources = {
-        's1': PointSource('s1', 0, 0, np.ones((250 * 30,))),
-        's2': PointSource('s2', 0, 1, np.ones((250 * 30,))),
+        's1': PointSource('s1', 0, 0, WAVEFORM),
+        's2': PointSource('s2', 0, 1, WAVEFORM),
     }
     stc = sc.to_stc()
     assert stc.data.shape[0] == 2, 'Expected two sources in stc'
@@ -58,10 +64,10 @@ def test_sourceconfiguration_to_stc_signal_and_noise():
 
     sc = SourceConfiguration(src, sfreq=250, duration=30)
     sc._sources = {
-        's1': PointSource('s1', 0, 0, np.ones((250 * 30,))),
+        's1': PointSource('s1', 0, 0, WAVEFORM),
     }
     sc._noise_sources = {
-        'n1': PointSource('n1', 0, 1, np.ones((250 * 30,))),
+        'n1': PointSource('n1', 0, 1, WAVEFORM),
     }
     stc = sc.to_stc()
     assert stc.data.shape[0] == 2, 'Expected two sources in stc'
@@ -74,10 +80,9 @@ def test_sourceconfiguration_to_stc_patch():
     )
 
     sc = SourceConfiguration(src, sfreq=250, duration=30)
-    n_samples = sc.sfreq * sc.duration
     sources = [
-        PatchSource('s1', 0, [0, 2], np.ones((n_samples,))),
-        PatchSource('s2', 1, [0, 1], np.ones((n_samples,)))
+        PatchSource('s1', 0, [0, 2], WAVEFORM),
+        PatchSource('s2', 1, [0, 1], WAVEFORM)
     ]
     sc._sources = {s.name: s for s in sources}
     stc = sc.to_stc()
@@ -92,13 +97,12 @@ def test_sourceconfiguration_to_raw(apply_forward_mock):
     )
 
     sc = SourceConfiguration(src, sfreq=250, duration=30)
-    n_samples = sc.sfreq * sc.duration
     sc._sources = {
-        's1': PointSource('s1', 0, 0, np.ones((n_samples,))),
-        's2': PatchSource('s2', 1, [0, 1], np.ones((n_samples,)))
+        's1': PointSource('s1', 0, 0, WAVEFORM),
+        's2': PatchSource('s2', 1, [0, 1], WAVEFORM)
     }
     sc._noise_sources = {
-        'n1': PointSource('n1', 0, 1, np.ones((n_samples,))),
+        'n1': PointSource('n1', 0, 1, WAVEFORM),
     }
 
     raw = sc.to_raw([], [])
@@ -2,7 +2,7 @@ import numpy as np
 import networkx as nx
 import pytest
 
-from mock import patch
+from unittest.mock import patch
 
 from meegsim.coupling_graph import generate_walkaround, traverse_tree, _set_coupling
 
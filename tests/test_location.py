@@ -3,7 +3,7 @@ import numpy as np
 import mne
 import pytest
 
-from mock import patch
+from unittest.mock import patch
 
 from meegsim.location import select_random
 from meegsim.utils import unpack_vertices
@@ -81,6 +81,17 @@ def test_invalid_vertices_error():
         select_random(single_src, vertices=[[5, 6]], n=1)
 
 
+def test_non_integer_vertices_error():
+    # Non-integer vertices should not be truncated to valid ones
+    vertices = [[0, 1, 2], [0, 1, 2]]
+    dual_src = create_dummy_sourcespace(vertices)
+    with pytest.raises(ValueError, match="Some vertices are not contained in the src."):
+        select_random(dual_src, vertices=[[0, 1], [1.9]], n=2, random_state=0)
+
+    with pytest.raises(ValueError, match="Some vertices are not contained in the src."):
+        select_random(dual_src, vertices=[[0.5, 1], [0]], n=2, random_state=0)
+
+
 def test_invalid_source_space_length():
     # Test error for incorrect source space length
     with pytest.raises(ValueError, match=re.escape("Src must contain either one (volume) or two (surface) source spaces.")):
@@ -3,7 +3,7 @@ import networkx as nx
 import numpy as np
 import pytest
 
-from mock import patch, Mock
+from unittest.mock import patch, Mock
 
 from meegsim.simulate import SourceSimulator, _simulate
 from meegsim.source_groups import PointSourceGroup
@@ -51,56 +51,50 @@ def test_get_sensor_space_variance_no_filter_sel_vert():
         f"Expected variance {expected_variance}, but got {variance}"
 
 
-@patch('meegsim.snr.filtfilt', return_value=np.ones((4, 500)))
-@patch('meegsim.snr.butter', return_value=(0, 0))
-def test_get_sensor_space_variance_with_filter(butter_mock, filtfilt_mock):
+@patch('meegsim.utils.sosfiltfilt', return_value=np.ones((4, 500)))
+@patch('meegsim.utils._butter_bandpass', return_value=np.zeros((1, 6)))
+def test_get_sensor_space_variance_with_filter(butter_bandpass_mock, sosfiltfilt_mock):
     fwd = prepare_forward(5, 10)
     vertices = [[0, 1], [0, 1]]
     stc = prepare_stc(vertices)
     variance = get_sensor_space_variance(stc, fwd, fmin=8, fmax=12, filter=True)
 
-    # Check that butter and filtfilt were called
-    butter_mock.assert_called()
-    filtfilt_mock.assert_called()
-
-    # Check that fmin and fmax are set to default values by looking at
-    # the normalized frequencies (second argument of scipy.signal.butter)
-    butter_args = butter_mock.call_args
-    sfreq = stc.sfreq
-    expected_wmin = 8.0 / (0.5 * sfreq)
-    expected_wmax = 12.0 / (0.5 * sfreq)
-    actual_wmin, actual_wmax = butter_args.args[1]
-    assert np.isclose(actual_wmin, expected_wmin), \
-        f"Expected fmin to be {expected_wmin}, got {actual_wmin}"
-    assert np.isclose(actual_wmax, expected_wmax), \
-        f"Expected fmax to be {expected_wmax}, got {actual_wmax}"
+    # Check that the filter was designed and applied
+    butter_bandpass_mock.assert_called()
+    sosfiltfilt_mock.assert_called()
+
+    # Check that fmin, fmax and sfreq are passed correctly to the filter design
+    _, actual_fmin, actual_fmax, actual_sfreq = butter_bandpass_mock.call_args.args
+    assert np.isclose(actual_fmin, 8.0), \
+        f"Expected fmin to be 8.0, got {actual_fmin}"
+    assert np.isclose(actual_fmax, 12.0), \
+        f"Expected fmax to be 12.0, got {actual_fmax}"
+    assert np.isclose(actual_sfreq, stc.sfreq), \
+        f"Expected sfreq to be {stc.sfreq}, got {actual_sfreq}"
 
     assert variance >= 0, "Variance should be non-negative"
 
 
-@patch('meegsim.snr.filtfilt', return_value=np.ones((4, 500)))
-@patch('meegsim.snr.butter', return_value=(0, 0))
-def test_get_sensor_space_variance_with_filter_fmin_fmax(butter_mock, filtfilt_mock):
+@patch('meegsim.utils.sosfiltfilt', return_value=np.ones((4, 500)))
+@patch('meegsim.utils._butter_bandpass', return_value=np.zeros((1, 6)))
+def test_get_sensor_space_variance_with_filter_fmin_fmax(butter_bandpass_mock, sosfiltfilt_mock):
     fwd = prepare_forward(5, 10)
     vertices = [[0, 1], [0, 1]]
     stc = prepare_stc(vertices)
     get_sensor_space_variance(stc, fwd, filter=True, fmin=20., fmax=30.)
 
-    # Check that butter and filtfilt were called
-    butter_mock.assert_called()
-    filtfilt_mock.assert_called()
-
-    # Check that fmin and fmax are set to custom values by looking at
-    # the normalized frequencies (second argument of scipy.signal.butter)
-    butter_args = butter_mock.call_args
-    sfreq = stc.sfreq
-    expected_wmin = 20.0 / (0.5 * sfreq)
-    expected_wmax = 30.0 / (0.5 * sfreq)
-    actual_wmin, actual_wmax = butter_args.args[1]
-    assert np.isclose(actual_wmin, expected_wmin), \
-        f"Expected fmin to be {expected_wmin}, got {actual_wmin}"
-    assert np.isclose(actual_wmax, expected_wmax), \
-        f"Expected fmax to be {expected_wmax}, got {actual_wmax}"
+    # Check that the filter was designed and applied
+    butter_bandpass_mock.assert_called()
+    sosfiltfilt_mock.assert_called()
+
+    # Check that fmin, fmax and sfreq are passed correctly to the filter design
+    _, actual_fmin, actual_fmax, actual_sfreq = butter_bandpass_mock.call_args.args
+    assert np.isclose(actual_fmin, 20.0), \
+        f"Expected fmin to be 20.0, got {actual_fmin}"
+    assert np.isclose(actual_fmax, 30.0), \
+        f"Expected fmax to be 30.0, got {actual_fmax}"
+    assert np.isclose(actual_sfreq, stc.sfreq), \
+        f"Expected sfreq to be {stc.sfreq}, got {actual_sfreq}"
 
 
 def test_get_sensor_space_variance_no_fmin_fmax():
@@ -2,7 +2,7 @@ import numpy as np
 import pytest
 
 from functools import partial
-from mock import patch
+from unittest.mock import patch
 from meegsim.source_groups import (
     _BaseSourceGroup, PointSourceGroup, generate_names
 )
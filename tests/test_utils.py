@@ -4,8 +4,8 @@ import pytest
 
 from mne.io.constants import FIFF
 from meegsim.utils import (
-    _extract_hemi, unpack_vertices, combine_stcs, normalize_power, 
-    get_sfreq, vertices_to_mne
+    _extract_hemi, _butter_bandpass, _filter_bandpass, unpack_vertices, combine_stcs, 
+    normalize_power, get_sfreq, theoretical_plv, vertices_to_mne
 )
 
 from utils.prepare import prepare_source_space
@@ -84,6 +84,23 @@ def test_combine_stcs_overlap():
     assert np.array_equal(stc.data, expected_data)
 
 
+def test_combine_stcs_no_overlap_disjoint_ranges():
+    vertices1 = [[1, 2], []]
+    vertices2 = [[3, 4], [1, 2]]
+
+    stc1 = prepare_stc(vertices1)
+    stc2 = prepare_stc(vertices2)
+
+    # Vertices of stc2 should be appended after the ones from stc1
+    expected_vertices = [[1, 2, 3, 4], [1, 2]]
+    expected_data = np.tile([1, 2, 3, 4, 1, 2], reps=(5, 1)).T
+
+    stc = combine_stcs(stc1, stc2)
+    assert np.array_equal(stc.vertices[0], expected_vertices[0])
+    assert np.array_equal(stc.vertices[1], expected_vertices[1])
+    assert np.array_equal(stc.data, expected_data)
+
+
 def test_normalize_power():
     data = np.random.randn(10, 1000)
     normalized = normalize_power(data)
@@ -92,6 +109,36 @@ def test_normalize_power():
     assert data.shape == normalized.shape
     assert np.allclose(np.linalg.norm(normalized, axis=1), 1)
 
+    # Should normalize the data in place
+    assert normalized is data
+
+
+def test_filter_bandpass():
+    sfreq = 250
+    times = np.arange(10 * sfreq) / sfreq
+    in_band = np.sin(2 * np.pi * 10 * times)
+    out_band = np.sin(2 * np.pi * 50 * times)
+
+    # Only the component within the band should be preserved
+    filtered = _filter_bandpass(in_band + out_band, sfreq, fmin=8, fmax=12)
+    assert filtered.shape == in_band.shape
+    assert np.allclose(filtered[sfreq:-sfreq], in_band[sfreq:-sfreq], atol=0.05)
+
+    # The filter should be applied along the last axis
+    data = np.tile(in_band + out_band, (3, 1))
+    filtered = _filter_bandpass(data, sfreq, fmin=8, fmax=12)
+    assert filtered.shape == data.shape
+    assert np.allclose(filtered[:, sfreq:-sfreq], in_band[sfreq:-sfreq], atol=0.05)
+
+
+def test_butter_bandpass_cached():
+    sos1 = _butter_bandpass(2, 8., 12., 250.)
+    sos2 = _butter_bandpass(2, 8., 12., 250.)
+
+    # The coefficients should be designed only once for the same filter
+    assert sos1 is sos2
+    assert sos1.shape == (2, 6)
+
 
 def test_get_sfreq():
     sfreq = 250
@@ -136,9 +183,12 @@ def test_extract_hemi_raises():
         {'type': 'surf', 'id': FIFF.FIFFV_MNE_SURF_UNKNOWN}
     ]
 
-    with pytest.raises(ValueError, match='Unexpected ID'):
+    with pytest.raises(ValueError, match='Unexpected ID') as excinfo:
         _extract_hemi(src[0])
 
+    # The error should not be chained to any other exception
+    assert excinfo.value.__context__ is None
+
 
 def test_vertices_to_mne():
     src = prepare_source_space(
@@ -157,4 +207,22 @@ def test_vertices_to_mne():
     assert packed == [[0], [2]]
 
     packed = vertices_to_mne([(1, 0), (1, 2)], src)
-    assert packed == [[], [0, 2]]
\ No newline at end of file
+    assert packed == [[], [0, 2]]
+
+
+def test_theoretical_plv():
+    kappa = np.array([0, 0.1, 1, 10])
+    plv = theoretical_plv(kappa)
+
+    # Should be calculated element-wise for arrays
+    assert plv.shape == kappa.shape
+    assert plv[0] == 0
+    assert np.all(np.diff(plv) > 0)
+    assert np.isclose(theoretical_plv(1), plv[2])
+
+
+def test_theoretical_plv_large_kappa():
+    # Should not overflow for large values of kappa
+    plv = theoretical_plv(1000)
+    assert np.isfinite(plv)
+    assert 0.99 < plv < 1